@@ -7,6 +7,7 @@ import platform
 import subprocess
 import sys
 from pathlib import Path
+from typing import Any
 
 import click
 
@@ -20,27 +21,74 @@ def open_file(filepath: Path) -> None:
     else:
         subprocess.run(["xdg-open", filepath])
 
-from md2pdf import __version__
-from md2pdf.config import find_config, load_config
-from md2pdf.converter import convert_markdown_to_pdf
+
+def _convert_one(job: tuple[Path, Path, dict[str, Any], bool]) -> str | None:
+    """Convert a single file, returning an error message on failure.
+
+    Module-level so it can be dispatched to worker processes.
+    """
+    from md2pdf.converter import convert_markdown_to_pdf
+
+    input_file, output, config_data, verbose = job
+    try:
+        convert_markdown_to_pdf(input_file, output, config_data, verbose=verbose)
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def _report_result(
+    input_file: Path,
+    output: Path,
+    error: str | None,
+    open_after: bool,
+    batch: bool,
+) -> bool:
+    """Report the outcome of one conversion and open the PDF if requested.
+
+    Args:
+        input_file: Path to the input Markdown file.
+        output: Path to the output PDF file.
+        error: Conversion error message, or None on success.
+        open_after: Open the PDF file after creation.
+        batch: Prefix error messages with the input file name.
+
+    Returns:
+        True if the file was converted (and opened) without errors.
+    """
+    prefix = f"{input_file}: " if batch else ""
+    if error is None:
+        click.echo(f"Created: {output}")
+        if not open_after:
+            return True
+        try:
+            open_file(output)
+            return True
+        except Exception as e:
+            error = str(e)
+    click.echo(f"Error: {prefix}{error}", err=True)
+    return False
 
 
 @click.command()
 @click.argument(
-    "input_file",
+    "input_files",
+    nargs=-1,
+    required=True,
     type=click.Path(exists=True, dir_okay=False, path_type=Path),
 )
 @click.option(
     "-o",
     "--output",
     type=click.Path(dir_okay=False, path_type=Path),
-    help="Output PDF file path. Defaults to input filename with .pdf extension.",
+    help="Output PDF file path. Defaults to input filename with .pdf extension. "
+    "Only valid with a single input file.",
 )
 @click.option(
     "-c",
     "--config",
     "config_path",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    type=Path,  # Checked in main(), only when the config will be used
     help="Path to YAML configuration file.",
 )
 @click.option(
@@ -48,6 +96,14 @@ from md2pdf.converter import convert_markdown_to_pdf
     is_flag=True,
     help="Ignore all configuration files and use defaults only.",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of files to convert in parallel.",
+)
 @click.option(
     "-v",
     "--verbose",
@@ -60,59 +116,118 @@ from md2pdf.converter import convert_markdown_to_pdf
     is_flag=True,
     help="Open the PDF file after creation.",
 )
-@click.version_option(version=__version__, prog_name="md2pdf")
+@click.version_option(package_name="md2pdf", prog_name="md2pdf")
 def main(
-    input_file: Path,
+    input_files: tuple[Path, ...],
     output: Path | None,
     config_path: Path | None,
     no_config: bool,
+    jobs: int,
     verbose: bool,
     open_after: bool,
 ) -> None:
-    """Convert a Markdown file to PDF.
+    """Convert Markdown files to PDF.
 
-    INPUT_FILE is the path to the Markdown file to convert.
+    INPUT_FILES are the paths to the Markdown files to convert. Converting
+    several files in one run reuses the loaded libraries and caches.
 
     \b
     Examples:
         md2pdf document.md
         md2pdf document.md -o output.pdf
         md2pdf document.md --config custom.yaml
+        md2pdf docs/*.md -j 4
     """
-    # Determine output path
-    if output is None:
-        output = input_file.with_suffix(".pdf")
+    if output is not None and len(input_files) > 1:
+        raise click.UsageError("--output can only be used with a single input file.")
+
+    # Convert each file once, even if it is given twice (e.g. "a.md ./a.md")
+    unique_inputs: dict[Path, Path] = {}
+    for input_file in input_files:
+        unique_inputs.setdefault(input_file.resolve(), input_file)
+    input_files = tuple(unique_inputs.values())
+
+    # Refuse inputs that would overwrite each other's PDF (e.g. a.md, a.markdown)
+    output_sources: dict[Path, Path] = {}
+    for input_file in input_files:
+        file_output = (output or input_file.with_suffix(".pdf")).resolve()
+        if file_output in output_sources:
+            raise click.UsageError(
+                f"{output_sources[file_output]} and {input_file} would both be "
+                f"written to {file_output}."
+            )
+        output_sources[file_output] = input_file
+
+    # Only stat the config file when it is actually going to be used
+    if config_path is not None and not no_config and not config_path.is_file():
+        raise click.BadParameter(
+            f"File '{config_path}' does not exist or is not a file.",
+            param_hint="'-c' / '--config'",
+        )
+
+    # Deferred so --help/--version don't pay for yaml, markdown, xhtml2pdf, etc.
+    from md2pdf.config import find_config, load_config
 
-    # Load configuration
+    # Load configuration shared by all files
+    shared_config: dict[str, Any] | None = None
     if no_config:
-        config_data: dict = {}
+        shared_config = {}
         if verbose:
             click.echo("Using default configuration (--no-config specified).")
     elif config_path:
-        config_data = load_config(config_path)
+        shared_config = load_config(config_path)
         if verbose:
             click.echo(f"Using config: {config_path}")
-    else:
-        found_config = find_config(input_file)
-        if found_config:
-            config_data = load_config(found_config)
-            if verbose:
-                click.echo(f"Found config: {found_config}")
+
+    # Resolve output path and configuration for each file
+    conversions: list[tuple[Path, Path, dict[str, Any], bool]] = []
+    loaded_configs: dict[Path, dict[str, Any]] = {}
+    for input_file in input_files:
+        if shared_config is not None:
+            config_data = shared_config
         else:
-            config_data = {}
-            if verbose:
-                click.echo("No config file found, using defaults.")
+            found_config = find_config(input_file)
+            if found_config:
+                if found_config not in loaded_configs:
+                    loaded_configs[found_config] = load_config(found_config)
+                config_data = loaded_configs[found_config]
+                if verbose:
+                    click.echo(f"Found config: {found_config}")
+            else:
+                config_data = {}
+                if verbose:
+                    click.echo("No config file found, using defaults.")
+
+        file_output = output or input_file.with_suffix(".pdf")
+        conversions.append((input_file, file_output, config_data, verbose))
 
     # Convert
-    try:
+    batch = len(conversions) > 1
+    failed = False
+    processes = min(jobs, len(conversions))
+    if processes > 1:
+        import multiprocessing
+
         if verbose:
-            click.echo(f"Converting: {input_file}")
-        convert_markdown_to_pdf(input_file, output, config_data, verbose=verbose)
-        click.echo(f"Created: {output}")
-        if open_after:
-            open_file(output)
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
+            click.echo(
+                f"Converting {len(conversions)} files using {processes} processes"
+            )
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.map(_convert_one, conversions)
+        for (input_file, file_output, _, _), error in zip(conversions, results):
+            if not _report_result(input_file, file_output, error, open_after, batch):
+                failed = True
+    else:
+        # Report each file as soon as it is done
+        for conversion in conversions:
+            input_file, file_output, _, _ = conversion
+            if verbose:
+                click.echo(f"Converting: {input_file}")
+            error = _convert_one(conversion)
+            if not _report_result(input_file, file_output, error, open_after, batch):
+                failed = True
+
+    if failed:
         sys.exit(1)
 
 
@@ -2,14 +2,29 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import functools
+import sys
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 import yaml
 
+# Prefer the libyaml-backed loader when available
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+_T = TypeVar("_T")
+
+# Config objects are shared through the merge_config cache, so keep them
+# immutable; dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_OPTIONS: dict[str, Any] = (
+    {"frozen": True, "slots": True}
+    if sys.version_info >= (3, 10)
+    else {"frozen": True}
+)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class MarginsConfig:
     """Page margin configuration."""
 
@@ -19,7 +34,7 @@ class MarginsConfig:
     right: str = "2cm"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FontFace:
     """Custom font-face registration."""
 
@@ -29,7 +44,7 @@ class FontFace:
     style: str = "normal"  # normal, italic
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FontConfig:
     """Font configuration."""
 
@@ -38,7 +53,7 @@ class FontConfig:
     line_height: float = 1.5
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class HeaderFooterConfig:
     """Header or footer configuration."""
 
@@ -46,7 +61,7 @@ class HeaderFooterConfig:
     height: str = "1.5cm"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TitlePageConfig:
     """Title page configuration."""
 
@@ -54,12 +69,12 @@ class TitlePageConfig:
     content: str = ""
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Config:
     """Complete md2pdf configuration."""
 
     font: FontConfig = field(default_factory=FontConfig)
-    fonts: list[FontFace] = field(default_factory=list)
+    fonts: tuple[FontFace, ...] = ()
     margins: MarginsConfig = field(default_factory=MarginsConfig)
     page_size: str = "A4"
     header: HeaderFooterConfig = field(default_factory=HeaderFooterConfig)
@@ -67,6 +82,21 @@ class Config:
     title_page: TitlePageConfig = field(default_factory=TitlePageConfig)
 
 
+# Nested config sections, keyed by their name in the YAML file
+_SECTIONS: dict[str, type] = {
+    "font": FontConfig,
+    "margins": MarginsConfig,
+    "header": HeaderFooterConfig,
+    "footer": HeaderFooterConfig,
+    "title_page": TitlePageConfig,
+}
+
+_FIELD_NAMES: dict[type, frozenset[str]] = {
+    cls: frozenset(f.name for f in fields(cls))
+    for cls in (*_SECTIONS.values(), FontFace)
+}
+
+
 def find_config(input_file: Path) -> Path | None:
     """Find configuration file using search hierarchy.
 
@@ -81,11 +111,17 @@ def find_config(input_file: Path) -> Path | None:
     Returns:
         Path to config file if found, None otherwise.
     """
-    search_paths = [
-        input_file.parent / "md2pdf.yaml",
-        Path.cwd() / "md2pdf.yaml",
-        Path.home() / ".md2pdf.yaml",
-    ]
+    return _find_config_cached(input_file.parent, Path.cwd())
+
+
+@functools.lru_cache(maxsize=32)
+def _find_config_cached(directory: Path, cwd: Path) -> Path | None:
+    """Search for a config file, cached per (input directory, cwd) pair."""
+    search_paths = [directory / "md2pdf.yaml"]
+    # Skip the second lookup when the input file lives in the cwd
+    if directory.absolute() != cwd:
+        search_paths.append(cwd / "md2pdf.yaml")
+    search_paths.append(Path.home() / ".md2pdf.yaml")
 
     for path in search_paths:
         if path.is_file():
@@ -103,8 +139,8 @@ def load_config(config_path: Path) -> dict[str, Any]:
     Returns:
         Dictionary containing configuration values.
     """
-    with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    with open(config_path, "rb") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
 
 
 def merge_config(user_config: dict[str, Any]) -> Config:
@@ -116,58 +152,71 @@ def merge_config(user_config: dict[str, Any]) -> Config:
     Returns:
         Complete Config object with defaults filled in.
     """
-    config = Config()
-
-    if "font" in user_config:
-        font_data = user_config["font"]
-        config.font = FontConfig(
-            family=font_data.get("family", config.font.family),
-            size=font_data.get("size", config.font.size),
-            line_height=font_data.get("line_height", config.font.line_height),
-        )
+    try:
+        frozen_config = _freeze(user_config)
+        hash(frozen_config)
+    except TypeError:
+        # Unhashable values (e.g. YAML sets) - merge without caching
+        return _merge_config(user_config)
+    return _merge_config_cached(frozen_config)
 
-    if "margins" in user_config:
-        margins_data = user_config["margins"]
-        config.margins = MarginsConfig(
-            top=margins_data.get("top", config.margins.top),
-            bottom=margins_data.get("bottom", config.margins.bottom),
-            left=margins_data.get("left", config.margins.left),
-            right=margins_data.get("right", config.margins.right),
-        )
+
+@functools.lru_cache(maxsize=16)
+def _merge_config_cached(frozen_config: Any) -> Config:
+    """Merge a frozen user configuration, cached per distinct config."""
+    return _merge_config(_thaw(frozen_config))
+
+
+def _merge_config(user_config: dict[str, Any]) -> Config:
+    """Build a Config from a user configuration dictionary."""
+    config_kwargs: dict[str, Any] = {}
+
+    for key, section_cls in _SECTIONS.items():
+        if key in user_config:
+            config_kwargs[key] = _from_dict(section_cls, user_config[key])
 
     if "page_size" in user_config:
-        config.page_size = user_config["page_size"]
+        config_kwargs["page_size"] = user_config["page_size"]
 
-    if "header" in user_config:
-        header_data = user_config["header"]
-        config.header = HeaderFooterConfig(
-            content=header_data.get("content", ""),
-            height=header_data.get("height", "1.5cm"),
+    if "fonts" in user_config:
+        config_kwargs["fonts"] = tuple(
+            _from_dict(FontFace, font) for font in user_config["fonts"]
         )
 
-    if "footer" in user_config:
-        footer_data = user_config["footer"]
-        config.footer = HeaderFooterConfig(
-            content=footer_data.get("content", ""),
-            height=footer_data.get("height", "1.5cm"),
-        )
+    return Config(**config_kwargs)
 
-    if "title_page" in user_config:
-        title_page_data = user_config["title_page"]
-        config.title_page = TitlePageConfig(
-            enabled=title_page_data.get("enabled", False),
-            content=title_page_data.get("content", ""),
-        )
 
-    if "fonts" in user_config:
-        config.fonts = [
-            FontFace(
-                family=font.get("family", ""),
-                src=font.get("src", ""),
-                weight=font.get("weight", "normal"),
-                style=font.get("style", "normal"),
-            )
-            for font in user_config["fonts"]
-        ]
-
-    return config
+def _from_dict(cls: type[_T], data: dict[str, Any]) -> _T:
+    """Build a config dataclass from a dict, ignoring unknown keys.
+
+    Args:
+        cls: Config dataclass to instantiate.
+        data: User-provided values for the dataclass fields.
+
+    Returns:
+        Instance with user values applied over the field defaults.
+    """
+    names = _FIELD_NAMES[cls]
+    return cls(**{key: value for key, value in data.items() if key in names})
+
+
+def _freeze(value: Any) -> Any:
+    """Convert nested dicts/lists into a hashable form for caching.
+
+    Dicts become frozensets of (key, value) pairs and lists become tuples,
+    so the two shapes never collide and _thaw() can restore them.
+    """
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Inverse of _freeze()."""
+    if isinstance(value, frozenset):
+        return {key: _thaw(item) for key, item in value}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from datetime import datetime
 from io import BytesIO
 from pathlib import Path
@@ -13,6 +14,23 @@ from xhtml2pdf import pisa
 from md2pdf.config import merge_config
 from md2pdf.templates import build_html_document
 
+# First level-1 heading line ("# Title"), used as the document title
+_H1_RE = re.compile(r"^[ \t]*# [ \t]*(\S.*?)\s*$", re.MULTILINE)
+
+_markdown: markdown.Markdown | None = None
+
+
+def _get_markdown() -> markdown.Markdown:
+    """Return the shared Markdown converter, creating it on first use."""
+    global _markdown
+    if _markdown is None:
+        _markdown = markdown.Markdown(
+            output_format="html5",
+            extensions=["tables", "fenced_code", "md_in_html", "sane_lists"],
+            tab_length=2,  # Allow 2-space indentation for nested lists
+        )
+    return _markdown
+
 
 def convert_markdown_to_pdf(
     input_file: Path,
@@ -31,19 +49,17 @@ def convert_markdown_to_pdf(
     # Merge configuration with defaults
     config = merge_config(user_config)
 
-    # Read Markdown content
-    markdown_content = input_file.read_text(encoding="utf-8")
+    # Read Markdown content - decode the raw bytes in one step and only
+    # translate line endings when the file actually contains CR characters
+    markdown_content = input_file.read_bytes().decode("utf-8")
+    if "\r" in markdown_content:
+        markdown_content = markdown_content.replace("\r\n", "\n").replace("\r", "\n")
 
     # Extract metadata for template placeholders
     metadata = extract_metadata(input_file, markdown_content)
 
     # Convert Markdown to HTML
-    md = markdown.Markdown(
-        output_format="html5",
-        extensions=["tables", "fenced_code", "md_in_html", "sane_lists"],
-        tab_length=2,  # Allow 2-space indentation for nested lists
-    )
-    html_body = md.convert(markdown_content)
+    html_body = _get_markdown().reset().convert(markdown_content)
 
     # Build complete HTML document with embedded CSS
     html_document = build_html_document(
@@ -52,10 +68,11 @@ def convert_markdown_to_pdf(
         metadata=metadata,
     )
 
-    # Render PDF using xhtml2pdf
-    with open(output_file, "wb") as pdf_file:
+    # Render PDF using xhtml2pdf, passing UTF-8 bytes so pisa doesn't re-encode
+    html_source = BytesIO(html_document.encode("utf-8"))
+    with open(output_file, "wb", buffering=1 << 20) as pdf_file:
         pisa_status = pisa.CreatePDF(
-            src=html_document,
+            src=html_source,
             dest=pdf_file,
             encoding="utf-8",
         )
@@ -75,16 +92,13 @@ def extract_metadata(input_file: Path, content: str) -> dict[str, str]:
         Dictionary of metadata values.
     """
     # Extract title from first H1 heading if present
-    title = input_file.stem
-    for line in content.split("\n"):
-        line = line.strip()
-        if line.startswith("# "):
-            title = line[2:].strip()
-            break
+    match = _H1_RE.search(content)
+    title = match.group(1) if match else input_file.stem
 
+    now = datetime.now()
     return {
         "title": title,
         "filename": input_file.name,
-        "date": datetime.now().strftime("%Y-%m-%d"),
-        "datetime": datetime.now().strftime("%Y-%m-%d %H:%M"),
+        "date": now.strftime("%Y-%m-%d"),
+        "datetime": now.strftime("%Y-%m-%d %H:%M"),
     }
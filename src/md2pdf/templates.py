@@ -2,173 +2,62 @@
 
 from __future__ import annotations
 
-from jinja2 import Environment, BaseLoader
+import functools
+import re
+from html import escape
+from typing import TYPE_CHECKING, Any
 
 from md2pdf.config import Config
 
+if TYPE_CHECKING:
+    from jinja2 import Environment
 
-def build_html_document(
-    body_content: str,
-    config: Config,
-    metadata: dict[str, str],
-) -> str:
-    """Build complete HTML document with embedded CSS for xhtml2pdf.
-
-    Args:
-        body_content: HTML content converted from Markdown.
-        config: Configuration object.
-        metadata: Document metadata for template placeholders.
-
-    Returns:
-        Complete HTML document string.
-    """
-    env = Environment(loader=BaseLoader())
-
-    # Process header template - replace page number placeholders with xhtml2pdf tags
-    header_html = ""
-    if config.header.content:
-        header_content = _convert_page_placeholders(config.header.content)
-        header_template = env.from_string(header_content)
-        header_html = header_template.render(**metadata)
-
-    # Process footer template
-    footer_html = ""
-    if config.footer.content:
-        footer_content = _convert_page_placeholders(config.footer.content)
-        footer_template = env.from_string(footer_content)
-        footer_html = footer_template.render(**metadata)
-
-    # Process title page template
-    title_page_html = ""
-    if config.title_page.enabled and config.title_page.content:
-        title_page_template = env.from_string(config.title_page.content)
-        title_page_html = title_page_template.render(**metadata)
-
-    # Generate stylesheet
-    has_title_page = bool(config.title_page.enabled and config.title_page.content)
-    stylesheet = generate_stylesheet(config, has_title_page=has_title_page)
-
-    # Build header/footer divs - these are pulled into frames by -pdf-frame-content
-    header_div = f'<div id="header_div">{header_html}</div>' if header_html else ""
-    footer_div = f'<div id="footer_div">{footer_html}</div>' if footer_html else ""
-
-    # Build title page div
-    title_page_div = f'<div id="title-page">{title_page_html}</div>' if title_page_html else ""
+_jinja_env: Environment | None = None
 
-    # Build document
-    document = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>{metadata.get('title', 'Document')}</title>
-    <style>
-{stylesheet}
-    </style>
-</head>
-<body>
-    {header_div}
-    {footer_div}
-    {title_page_div}
-    {body_content}
-</body>
-</html>"""
-
-    return document
+_PAGE_PLACEHOLDER_RE = re.compile(r'<span class="page-(number|count)"></span>')
+_PAGE_PLACEHOLDER_TAGS = {
+    "number": "<pdf:pagenumber>",
+    "count": "<pdf:pagecount>",
+}
 
 
-def _convert_page_placeholders(content: str) -> str:
-    """Convert CSS-style page placeholders to xhtml2pdf tags.
+def _get_env() -> Environment:
+    """Return the shared Jinja2 environment, creating it on first use."""
+    global _jinja_env
+    if _jinja_env is None:
+        from jinja2 import BaseLoader, Environment
 
-    Args:
-        content: HTML content with placeholders.
+        # Metadata is plain text, so escape it wherever a template outputs it
+        _jinja_env = Environment(loader=BaseLoader(), autoescape=True)
+    return _jinja_env
 
-    Returns:
-        Content with xhtml2pdf-compatible page number tags.
-    """
-    # Replace span-based placeholders with xhtml2pdf PDF tags
-    content = content.replace(
-        '<span class="page-number"></span>',
-        '<pdf:pagenumber>'
-    )
-    content = content.replace(
-        '<span class="page-count"></span>',
-        '<pdf:pagecount>'
-    )
-    return content
 
+_FONT_FACE_TEMPLATE = """@font-face {{
+    font-family: "{family}";
+    src: url("{src}");
+    font-weight: {weight};
+    font-style: {style};
+}}"""
 
-def _generate_font_face_css(config: Config) -> str:
-    """Generate @font-face CSS rules for custom fonts.
-
-    Args:
-        config: Configuration object.
-
-    Returns:
-        CSS string with @font-face declarations.
-    """
-    if not config.fonts:
-        return ""
-
-    font_faces = []
-    for font in config.fonts:
-        if font.family and font.src:
-            font_faces.append(f"""@font-face {{
-    font-family: "{font.family}";
-    src: url("{font.src}");
-    font-weight: {font.weight};
-    font-style: {font.style};
-}}""")
-
-    return "\n".join(font_faces) + "\n" if font_faces else ""
-
-
-def generate_stylesheet(config: Config, has_title_page: bool = False) -> str:
-    """Generate CSS stylesheet for xhtml2pdf.
-
-    Args:
-        config: Configuration object.
-        has_title_page: Whether the document has a title page.
-
-    Returns:
-        CSS stylesheet string.
-    """
-    # Generate @font-face rules for custom fonts
-    font_face_css = _generate_font_face_css(config)
-
-    # Add named page rule to hide header/footer on title page
-    title_page_css = ""
-    if has_title_page:
-        title_page_css = f"""
-@page titlepage {{
-    size: {config.page_size};
-    margin: {config.margins.top} {config.margins.right} {config.margins.bottom} {config.margins.left};
-}}
-
-#title-page {{
-    page: titlepage;
-    page-break-after: always;
-}}
-"""
-
-    css = f"""
+_CSS_TEMPLATE = """
 @page {{
-    size: {config.page_size};
-    margin: {config.margins.top} {config.margins.right} {config.margins.bottom} {config.margins.left};
+    size: {page_size};
+    margin: {margin_top} {margin_right} {margin_bottom} {margin_left};
 
     @frame header {{
         -pdf-frame-content: header_div;
         top: 0.5cm;
-        margin-left: {config.margins.left};
-        margin-right: {config.margins.right};
-        height: {config.header.height};
+        margin-left: {margin_left};
+        margin-right: {margin_right};
+        height: {header_height};
     }}
 
     @frame footer {{
         -pdf-frame-content: footer_div;
         bottom: 0.5cm;
-        margin-left: {config.margins.left};
-        margin-right: {config.margins.right};
-        height: {config.footer.height};
+        margin-left: {margin_left};
+        margin-right: {margin_right};
+        height: {footer_height};
     }}
 }}
 
@@ -185,9 +74,9 @@ def generate_stylesheet(config: Config, has_title_page: bool = False) -> str:
 
 /* Base typography */
 body {{
-    font-family: {config.font.family};
-    font-size: {config.font.size};
-    line-height: {config.font.line_height};
+    font-family: {font_family};
+    font-size: {font_size};
+    line-height: {line_height};
     color: #1a1a1a;
 }}
 
@@ -292,4 +181,194 @@ hr {{
 }}
 """
 
-    return font_face_css + css + title_page_css
+# Named page rule to hide header/footer on the title page
+_TITLE_PAGE_CSS_TEMPLATE = """
+@page titlepage {{
+    size: {page_size};
+    margin: {margin_top} {margin_right} {margin_bottom} {margin_left};
+}}
+
+#title-page {{
+    page: titlepage;
+    page-break-after: always;
+}}
+"""
+
+
+def build_html_document(
+    body_content: str,
+    config: Config,
+    metadata: dict[str, str],
+) -> str:
+    """Build complete HTML document with embedded CSS for xhtml2pdf.
+
+    Args:
+        body_content: HTML content converted from Markdown.
+        config: Configuration object.
+        metadata: Document metadata for template placeholders.
+
+    Returns:
+        Complete HTML document string.
+    """
+    # Process header template - replace page number placeholders with xhtml2pdf tags
+    header_html = ""
+    if config.header.content:
+        header_content = _convert_page_placeholders(config.header.content)
+        header_html = _render_template(header_content, metadata)
+
+    # Process footer template
+    footer_html = ""
+    if config.footer.content:
+        footer_content = _convert_page_placeholders(config.footer.content)
+        footer_html = _render_template(footer_content, metadata)
+
+    # Process title page template
+    title_page_html = ""
+    if config.title_page.enabled and config.title_page.content:
+        title_page_html = _render_template(config.title_page.content, metadata)
+
+    # Generate stylesheet
+    has_title_page = bool(config.title_page.enabled and config.title_page.content)
+    stylesheet = generate_stylesheet(config, has_title_page=has_title_page)
+
+    # Build header/footer divs - these are pulled into frames by -pdf-frame-content
+    header_div = f'<div id="header_div">{header_html}</div>' if header_html else ""
+    footer_div = f'<div id="footer_div">{footer_html}</div>' if footer_html else ""
+
+    # Build title page div
+    title_page_div = f'<div id="title-page">{title_page_html}</div>' if title_page_html else ""
+
+    # Build document - joined in one pass to avoid copying the body repeatedly
+    return "".join(
+        [
+            '<!DOCTYPE html>\n<html>\n<head>\n    <meta charset="UTF-8">\n',
+            "    <title>",
+            escape(metadata.get("title", "Document")),
+            "</title>\n    <style>\n",
+            stylesheet,
+            "\n    </style>\n</head>\n<body>\n    ",
+            header_div,
+            "\n    ",
+            footer_div,
+            "\n    ",
+            title_page_div,
+            "\n    ",
+            body_content,
+            "\n</body>\n</html>",
+        ]
+    )
+
+
+def _render_template(content: str, metadata: dict[str, str]) -> str:
+    """Render Jinja2 placeholders, skipping Jinja for plain content.
+
+    Args:
+        content: HTML content, possibly containing Jinja2 syntax.
+        metadata: Document metadata for template placeholders.
+
+    Returns:
+        Rendered content.
+    """
+    if "{{" not in content and "{%" not in content and "{#" not in content:
+        return content
+    return _get_env().from_string(content).render(**metadata)
+
+
+def _convert_page_placeholders(content: str) -> str:
+    """Convert CSS-style page placeholders to xhtml2pdf tags.
+
+    Args:
+        content: HTML content with placeholders.
+
+    Returns:
+        Content with xhtml2pdf-compatible page number tags.
+    """
+    if '<span class="page-' not in content:
+        return content
+    # Replace span-based placeholders with xhtml2pdf PDF tags in one pass
+    return _PAGE_PLACEHOLDER_RE.sub(
+        lambda match: _PAGE_PLACEHOLDER_TAGS[match.group(1)], content
+    )
+
+
+def _generate_font_face_css(config: Config) -> str:
+    """Generate @font-face CSS rules for custom fonts.
+
+    Args:
+        config: Configuration object.
+
+    Returns:
+        CSS string with @font-face declarations.
+    """
+    if not config.fonts:
+        return ""
+
+    font_faces = []
+    for font in config.fonts:
+        if font.family and font.src:
+            font_faces.append(
+                _FONT_FACE_TEMPLATE.format(
+                    family=font.family,
+                    src=font.src,
+                    weight=font.weight,
+                    style=font.style,
+                )
+            )
+
+    return "\n".join(font_faces) + "\n" if font_faces else ""
+
+
+def generate_stylesheet(config: Config, has_title_page: bool = False) -> str:
+    """Generate CSS stylesheet for xhtml2pdf.
+
+    Args:
+        config: Configuration object.
+        has_title_page: Whether the document has a title page.
+
+    Returns:
+        CSS stylesheet string.
+    """
+    # Generate @font-face rules for custom fonts
+    font_face_css = _generate_font_face_css(config)
+
+    css_values: dict[str, Any] = {
+        "page_size": config.page_size,
+        "margin_top": config.margins.top,
+        "margin_right": config.margins.right,
+        "margin_bottom": config.margins.bottom,
+        "margin_left": config.margins.left,
+        "header_height": config.header.height,
+        "footer_height": config.footer.height,
+        "font_family": config.font.family,
+        "font_size": config.font.size,
+        "line_height": config.font.line_height,
+    }
+    try:
+        hash(tuple(css_values.values()))
+    except TypeError:
+        # Unhashable values (e.g. a YAML list) - render without caching
+        css = _render_css(has_title_page, **css_values)
+    else:
+        css = _render_css_cached(has_title_page, **css_values)
+
+    return font_face_css + css
+
+
+def _render_css(has_title_page: bool, **values: Any) -> str:
+    """Fill the page and title page stylesheet templates.
+
+    Args:
+        has_title_page: Whether to append the title page rules.
+        **values: Values for the template placeholders.
+
+    Returns:
+        CSS stylesheet string.
+    """
+    css = _CSS_TEMPLATE.format(**values)
+    if has_title_page:
+        css += _TITLE_PAGE_CSS_TEMPLATE.format(**values)
+    return css
+
+
+# Rendered CSS cached per distinct set of (hashable) values
+_render_css_cached = functools.lru_cache(maxsize=8)(_render_css)